@@ -7,3 +7,14 @@ ACCOUNT_PLAN_TEMPLATE = {
     "recommended_strategy": "",
     "sources": []
 }
+
+# Plan sections written by Gemini ("sources" is filled in from the search results)
+PLAN_SECTION_KEYS = [k for k in ACCOUNT_PLAN_TEMPLATE if k != "sources"]
+
+# Gemini structured-output schema for the synthesized sections
+ACCOUNT_PLAN_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {k: {"type": "STRING"} for k in PLAN_SECTION_KEYS},
+    "required": PLAN_SECTION_KEYS,
+    "property_ordering": PLAN_SECTION_KEYS,
+}
@@ -0,0 +1,81 @@
+# agent/cache.py
+"""
+SqliteCache: small persistent key/value cache with per-entry TTL and optional
+tags, used to skip repeated Tavily searches and Gemini plan syntheses across runs.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from config import CACHE_DB_PATH
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class SqliteCache:
+    def __init__(self, path: str = CACHE_DB_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # One connection shared by all threads; access is serialized by the lock.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, tag TEXT, expires_at REAL NOT NULL)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+            if "tag" not in columns:
+                # cache files created before tags existed
+                self._conn.execute("ALTER TABLE cache ADD COLUMN tag TEXT")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cache_tag ON cache (tag)")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached value for key, or None if missing or expired.
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                value, expires_at = row
+                if expires_at < time.time():
+                    with self._conn:
+                        self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    return None
+                return value
+        except sqlite3.Error as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+            return None
+
+    def set(self, key: str, value: str, ttl: float, tag: Optional[str] = None) -> None:
+        """
+        Store value under key for ttl seconds, optionally labelled with tag for invalidate().
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, tag, expires_at) VALUES (?, ?, ?, ?)",
+                    (key, value, tag, time.time() + ttl),
+                )
+        except sqlite3.Error as e:
+            logger.warning("Cache write failed for %s: %s", key, e)
+
+    def invalidate(self, tag: str) -> int:
+        """
+        Remove every entry stored with tag. Returns the number of entries removed.
+        """
+        try:
+            with self._lock, self._conn:
+                return self._conn.execute("DELETE FROM cache WHERE tag = ?", (tag,)).rowcount
+        except sqlite3.Error as e:
+            logger.warning("Cache invalidation failed for tag %s: %s", tag, e)
+            return 0
@@ -7,25 +7,61 @@ It uses Google Gemini (google-genai) to produce a concise, helpful answer.
 import logging
 import json
 import re
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional, Tuple
 
-from google import genai
-from config import GEMINI_API_KEY, GEMINI_TEXT_MODEL
+import numpy as np
+
+from agent.clients import get_gemini_client
+from agent.rate_limit import gemini_semaphore, retry_on_rate_limit
+from agent.semantic_cache import SemanticCache, normalize_embedding, plan_hash
+from config import GEMINI_TEXT_MODEL, GEMINI_EMBED_MODEL
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-_genai_client = genai.Client(api_key=GEMINI_API_KEY)
+# Shared across ChatAgent instances
+_answer_cache = SemanticCache()
+
+# Plan fields used as answer context
+_CONTEXT_KEYS = ["company_overview", "key_findings", "pain_points", "opportunities", "competitors", "recommended_strategy"]
+
+_CONTEXT_CACHE_SIZE = 32
+
+_NO_ANSWER = "I couldn't generate an answer. Try rephrasing the question or ask for a specific section of the plan."
 
 
 class ChatAgent:
-    def __init__(self, model: str = GEMINI_TEXT_MODEL):
-        self.client = _genai_client
+    def __init__(self, model: str = GEMINI_TEXT_MODEL, embed_model: str = GEMINI_EMBED_MODEL):
+        self.client = get_gemini_client()
         self.model = model
+        self.embed_model = embed_model
+        self.cache = _answer_cache
+        # plan_key -> prompt prefix (instructions + plan context), reused across questions
+        self._context_cache: Dict[str, str] = {}
+        # the server shares one ChatAgent across threadpool threads
+        self._context_lock = threading.Lock()
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed text for semantic cache lookups. Returns None if embedding is unavailable.
+        """
+        try:
+            with gemini_semaphore:
+                resp = self.client.models.embed_content(model=self.embed_model, contents=text)
+            return normalize_embedding(resp.embeddings[0].values)
+        except Exception as e:
+            logger.warning("Embedding failed, skipping semantic cache lookup: %s", e)
+            return None
+
+    @retry_on_rate_limit
+    def _generate(self, prompt: str) -> Any:
+        with gemini_semaphore:
+            return self.client.models.generate_content(model=self.model, contents=prompt)
 
     def _call_gemini(self, prompt: str) -> str:
         try:
-            resp = self.client.models.generate_content(model=self.model, contents=prompt)
+            resp = self._generate(prompt)
         except Exception as e:
             logger.exception("Gemini primary call failed: %s", e)
             try:
@@ -63,60 +99,100 @@ class ChatAgent:
 
         return (text_output or "").strip()
 
-    def answer(self, question: str, plan: Dict[str, Any]) -> str:
+    def _lookup_cached(self, question: str, plan: Dict[str, Any]) -> Tuple[str, Optional[np.ndarray], Optional[str]]:
         """
-        Produces an answer to `question` using `plan` as context.
-        The model is explicitly instructed NOT to modify the plan, only to reference it.
+        Check the answer cache for `question` against `plan`.
+        Returns (plan_key, question_embedding, cached_answer_or_None).
+        """
+        plan_key = plan_hash(plan, _CONTEXT_KEYS + ["sources"])
+        cached = self.cache.get_exact(plan_key, question)
+        if cached is not None:
+            logger.info("ChatAgent answer served from exact cache")
+            return plan_key, None, cached
+
+        embedding = self._embed(question)
+        if embedding is not None:
+            cached, sim = self.cache.lookup(plan_key, embedding)
+            if cached is not None:
+                logger.info("ChatAgent answer served from semantic cache (similarity %.3f)", sim)
+                return plan_key, embedding, cached
+        return plan_key, embedding, None
+
+    def _build_prompt(self, question: str, plan: Dict[str, Any], plan_key: str) -> str:
+        """
+        Prompt = plan context prefix (built once per plan and reused) + the question.
+        Everything that doesn't depend on the question comes first, so the prefix is
+        byte-identical across a chat session and Gemini's implicit prefix cache can reuse it.
         """
+        with self._context_lock:
+            prefix = self._context_cache.get(plan_key)
+        if prefix is None:
+            prefix = self._build_context_prefix(plan)
+            with self._context_lock:
+                if plan_key not in self._context_cache and len(self._context_cache) >= _CONTEXT_CACHE_SIZE:
+                    # dicts keep insertion order, so the first key is the oldest plan
+                    self._context_cache.pop(next(iter(self._context_cache)), None)
+                self._context_cache[plan_key] = prefix
+        return f"{prefix}\nQUESTION:\n{question}\n"
+
+    def _build_context_prefix(self, plan: Dict[str, Any]) -> str:
         # Build a compact context: include sections with labels and sources
         # but limit the amount so we don't exceed token caps.
-        def excerpt(s):
-            if not s:
-                return ""
-            s = str(s).strip()
-            return s if len(s) <= 1200 else s[:1200] + " ..."
+        def excerpt(s, _max=1200):
+            s = s.strip() if isinstance(s, str) else str(s).strip()
+            return s if len(s) <= _max else f"{s[:_max]} ..."
 
         context_lines = []
         # Use key plan fields as context
-        keys = ["company_overview", "key_findings", "pain_points", "opportunities", "competitors", "recommended_strategy"]
-        for k in keys:
+        for k in _CONTEXT_KEYS:
             val = plan.get(k, "")
             if val:
                 context_lines.append(f"{k}:\n{excerpt(val)}\n")
 
         # Sources (short list)
-        sources = plan.get("sources", []) or []
+        sources = (plan.get("sources") or [])[:6]
         if sources:
-            sources_excerpt = "\n".join([str(s) for s in sources[:6]])
+            sources_excerpt = "\n".join(sources if all(isinstance(s, str) for s in sources) else map(str, sources))
             context_lines.append(f"sources (first 6):\n{sources_excerpt}\n")
 
         context_text = "\n\n".join(context_lines)
 
-        prompt = f"""
+        return f"""
 You are a helpful, concise business research assistant.
 
 CONTEXT: Here is the account plan (do not change it). Use it to answer the user's question. If the plan does not contain enough info to answer, say you don't know and suggest what extra info you need or which external sources to check. Do NOT invent facts. If you cite something, indicate whether it comes from the plan or say 'outside plan — needs web check'.
 
-Account plan context (shortened):
-{context_text}
-
-QUESTION:
-{question}
-
 REQUIREMENTS:
 - Answer concisely (2-6 sentences) unless user asks for details.
 - If you are uncertain, say so and list 1-3 next steps for the user to verify the claim.
 - Indicate any plan section you referenced in square brackets, e.g. [Pain Points].
 - Output plain text only.
+
+Account plan context (shortened):
+{context_text}
 """
 
+    def answer(self, question: str, plan: Dict[str, Any]) -> str:
+        """
+        Produces an answer to `question` using `plan` as context.
+        The model is explicitly instructed NOT to modify the plan, only to reference it.
+        Answers are cached per plan; repeated or paraphrased questions are served from cache.
+        """
+        plan_key, embedding, cached = self._lookup_cached(question, plan)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_prompt(question, plan, plan_key)
+
         logger.info("ChatAgent answering question (truncated prompt)...")
         raw = self._call_gemini(prompt)
 
         # If the model returns a JSON wrapper or other noise, prefer the first paragraph
         if not raw:
-            return "I couldn't generate an answer. Try rephrasing the question or ask for a specific section of the plan."
+            return _NO_ANSWER
 
         # Clean up text (strip leading/trailing markers)
         # If model returns multiple lines, keep them as-is
-        return raw.strip()
+        answer = raw.strip()
+        self.cache.add(plan_key, question, embedding, answer)
+        return answer
@@ -0,0 +1,21 @@
+# agent/clients.py
+"""
+API clients shared by every agent in the process. Each client is created
+once, on first use, so the connection pool and auth state are reused.
+"""
+
+from functools import lru_cache
+
+from config import GEMINI_API_KEY, TAVILY_API_KEY
+
+
+@lru_cache(maxsize=None)
+def get_gemini_client():
+    from google import genai
+    return genai.Client(api_key=GEMINI_API_KEY)
+
+
+@lru_cache(maxsize=None)
+def get_tavily_client():
+    from tavily import TavilyClient
+    return TavilyClient(api_key=TAVILY_API_KEY)
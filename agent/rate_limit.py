@@ -0,0 +1,94 @@
+# agent/rate_limit.py
+"""
+Backoff and concurrency limits for outbound Gemini and Tavily calls.
+Rate-limited calls (HTTP 429 / quota errors) are retried with jittered
+exponential backoff, honoring a server-provided retry delay when present.
+"""
+
+import logging
+import os
+import re
+import threading
+from typing import Any, Optional
+
+from tenacity import retry, retry_if_exception, stop_after_attempt, stop_after_delay, wait_random_exponential
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Cap on concurrent Gemini requests across all agents in this process
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+gemini_semaphore = threading.BoundedSemaphore(GEMINI_MAX_CONCURRENCY)
+
+MAX_ATTEMPTS = 5
+MAX_RETRY_AFTER = 60.0  # never sleep longer than this, whatever the server asks for
+MAX_TOTAL_WAIT = 90.0  # stop retrying once this much time has passed since the first attempt
+
+_RATE_LIMIT_RE = re.compile(r"\b429\b|rate.?limit|resource.?exhausted|too many requests", re.IGNORECASE)
+_QUOTA_RE = re.compile(r"quota", re.IGNORECASE)
+_RETRY_AFTER_RE = re.compile(r"retry[-_ ]?after\D{0,5}(\d+(?:\.\d+)?)", re.IGNORECASE)
+_RETRY_DELAY_RE = re.compile(r"retry_?delay\W{0,5}(\d+(?:\.\d+)?)s", re.IGNORECASE)
+
+_backoff = wait_random_exponential(min=1, max=30)
+
+
+def _response_headers(exc: BaseException) -> Any:
+    response = getattr(exc, "response", None)
+    return getattr(response, "headers", None) or {}
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """
+    True if exc looks like a transient rate-limit error from Gemini or Tavily.
+    Quota errors only count when the server says when to retry: an exhausted
+    daily quota will not clear within the retry budget.
+    """
+    message = str(exc)
+    if _QUOTA_RE.search(message) and _retry_after(exc) is None:
+        return False
+    code = getattr(exc, "code", None) or getattr(exc, "status_code", None)
+    if code == 429:
+        return True
+    return bool(_RATE_LIMIT_RE.search(message))
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """
+    Server-requested delay in seconds, from a Retry-After header or the error message.
+    """
+    header = _response_headers(exc).get("retry-after")
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    message = str(exc)
+    m = _RETRY_AFTER_RE.search(message) or _RETRY_DELAY_RE.search(message)
+    return float(m.group(1)) if m else None
+
+
+def _wait(retry_state) -> float:
+    exc = retry_state.outcome.exception()
+    delay = _retry_after(exc) if exc is not None else None
+    if delay is not None:
+        return min(delay, MAX_RETRY_AFTER)
+    return _backoff(retry_state)
+
+
+def _log_retry(retry_state) -> None:
+    exc = retry_state.outcome.exception()
+    remaining = _response_headers(exc).get("x-ratelimit-remaining")
+    logger.warning(
+        "Rate limited (attempt %d/%d, x-ratelimit-remaining=%s); retrying in %.1fs: %s",
+        retry_state.attempt_number, MAX_ATTEMPTS, remaining, retry_state.next_action.sleep, exc,
+    )
+
+
+# Decorator for a single outbound call; re-raises the last error once attempts run out.
+retry_on_rate_limit = retry(
+    retry=retry_if_exception(is_rate_limited),
+    wait=_wait,
+    stop=stop_after_attempt(MAX_ATTEMPTS) | stop_after_delay(MAX_TOTAL_WAIT),
+    before_sleep=_log_retry,
+    reraise=True,
+)
@@ -5,29 +5,273 @@ using Google Gemini (google-genai). This version asks Gemini for much more
 elaborated content and will automatically re-ask to expand short sections.
 """
 
+import hashlib
 import json
 import re
 import logging
-from typing import Tuple, List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, List, Dict, Any, Optional, Callable
 
-from tavily import TavilyClient
-from google import genai
+from cachetools import TTLCache, cached
 
-from agent.account_plan_template import ACCOUNT_PLAN_TEMPLATE
-from config import TAVILY_API_KEY, GEMINI_API_KEY, GEMINI_TEXT_MODEL
+from agent.account_plan_template import ACCOUNT_PLAN_TEMPLATE, ACCOUNT_PLAN_SCHEMA, PLAN_SECTION_KEYS
+from agent.cache import SqliteCache
+from agent.clients import get_gemini_client, get_tavily_client
+from agent.rate_limit import gemini_semaphore, retry_on_rate_limit
+from config import GEMINI_TEXT_MODEL, RESEARCH_CHAR_BUDGET
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Initialize clients once
-_tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
-_genai_client = genai.Client(api_key=GEMINI_API_KEY)
+_cache = SqliteCache()
+
+_DAY = 24 * 3600
+SEARCH_CACHE_TTL = 6 * 3600  # Tavily results: 6 hours
+# Generated plan sections are cached individually; fast-moving sections expire sooner.
+SECTION_CACHE_TTL = {
+    "company_overview": 30 * _DAY,
+    "key_findings": 7 * _DAY,
+    "pain_points": 7 * _DAY,
+    "opportunities": 14 * _DAY,
+    "competitors": 30 * _DAY,
+    "recommended_strategy": 14 * _DAY,
+}
+
+# Upper bound on concurrent section expansions, to stay within Gemini rate limits
+MAX_PARALLEL_EXPANSIONS = 4
+
+# Shared, byte-identical prompt prefix for every synthesis/expansion call about the
+# same research, so Gemini's implicit prefix cache can reuse it. Keep anything that
+# varies per call (section names, output format) out of this text.
+_SYSTEM_INSTRUCTIONS = """You are an expert enterprise sales analyst preparing an account plan for the company below.
+Use evidence from the research. Where helpful, include brief inline citations in parentheses (e.g., 'According to [source]...')."""
+
+
+def _build_prompt(research_data: str, company_name: str, task: str) -> str:
+    """
+    Fixed-order prompt: instructions, research, company, then the task-specific suffix.
+    """
+    return f"{_SYSTEM_INSTRUCTIONS}\n\nResearch:\n{research_data}\n\nCompany: {company_name}\n---\n{task}"
+
+
+def company_tag(company_name: str) -> str:
+    """
+    Normalized company name (lower-cased, whitespace collapsed); used in queries/keys,
+    as the cache tag for invalidation, and by the server as its plan cache key.
+    """
+    return " ".join(company_name.lower().split())
+
+
+def _cache_key(kind: str, payload: str) -> str:
+    """
+    Cache key for the SQLite cache. blake2b is used for speed; keys only need
+    to be collision-free in practice, not cryptographically strong.
+    """
+    return f"{kind}:" + hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _compress(text: str, budget: int = RESEARCH_CHAR_BUDGET) -> str:
+    """
+    Bound the research text sent to Gemini: drop empty and duplicate paragraphs
+    (keeping first-seen order) and stop once `budget` characters are used.
+    """
+    kept: List[str] = []
+    used = 0
+    for para in dict.fromkeys(p.strip() for p in text.split("\n\n")):
+        if not para:
+            continue
+        if used + len(para) > budget:
+            if not kept:
+                kept.append(para[:budget])
+            break
+        kept.append(para)
+        used += len(para) + 2  # account for the "\n\n" separator
+    return "\n\n".join(kept)
+
+
+def _first_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} substring of text (braces inside strings are ignored).
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+# Lenient cleanup for almost-JSON model output (trailing commas)
+_TRAILING_COMMA_OBJ = re.compile(r",\s*}")
+_TRAILING_COMMA_ARR = re.compile(r",\s*\]")
+
+_HIGH_SURROGATES = ("d8", "d9", "da", "db")
+_JSON_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class _StreamedStringField:
+    """
+    Incrementally decodes one top-level string field out of JSON text that arrives
+    in chunks, so its value can be used before the whole object has been generated.
+    """
+
+    def __init__(self, key: str):
+        self._start_re = re.compile(r'"%s"\s*:\s*"' % re.escape(key))
+        self._raw = ""
+        self._pos: Optional[int] = None
+        self.done = False
+        self.decoded_chars = 0
+
+    def feed(self, chunk: str) -> str:
+        """
+        Add a chunk of raw JSON and return the newly decoded part of the field value.
+        """
+        if self.done:
+            return ""
+        self._raw += chunk
+        raw = self._raw
+        if self._pos is None:
+            m = self._start_re.search(raw)
+            if not m:
+                return ""
+            self._pos = m.end()
+
+        out = []
+        i = self._pos
+        while i < len(raw):
+            ch = raw[i]
+            if ch == '"':
+                self.done = True
+                i += 1
+                break
+            if ch == "\\":
+                if i + 1 >= len(raw):
+                    break  # escape split across chunks; wait for more
+                if raw[i + 1] == "u":
+                    end = i + 6
+                    if end > len(raw):
+                        break
+                    if raw[i + 2:i + 4].lower() in _HIGH_SURROGATES:
+                        # characters outside the BMP arrive as a \uD8xx\uDCxx pair; decode both together
+                        if end + 2 > len(raw) or (raw[end:end + 2] == "\\u" and end + 6 > len(raw)):
+                            break
+                        if raw[end:end + 2] == "\\u":
+                            end += 6
+                    try:
+                        out.append(json.loads('"%s"' % raw[i:end]))
+                    except ValueError:
+                        pass
+                    i = end
+                else:
+                    out.append(_JSON_ESCAPES.get(raw[i + 1], raw[i + 1]))
+                    i += 2
+                continue
+            out.append(ch)
+            i += 1
+        self._pos = i
+        text = "".join(out)
+        self.decoded_chars += len(text)
+        return text
+
+
+# In-process memo in front of the SQLite search cache; keys are (company, top_k).
+_search_memo: TTLCache = TTLCache(maxsize=128, ttl=3600)
+_search_memo_lock = threading.Lock()
+
+
+@retry_on_rate_limit
+def _tavily_search(query: str, top_k: int) -> Any:
+    return get_tavily_client().search(query=query, limit=top_k, include_raw_content=True)
+
+
+@cached(cache=_search_memo, lock=_search_memo_lock)
+def _tavily_fetch(company: str, top_k: int) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Run a Tavily search about company and flatten it into (combined_text, source_urls).
+    Memoized in-process for an hour and persisted in the SQLite cache for SEARCH_CACHE_TTL
+    (tagged with the company); errors propagate (and are not cached).
+    """
+    query = f"{company} company overview business model latest news competitors funding"
+    cache_key = _cache_key("search", f"{query}\x00{top_k}")
+    cached_value = _cache.get(cache_key)
+    if cached_value is not None:
+        logger.info("Tavily search served from cache for query: %s", query)
+        combined_text, sources = json.loads(cached_value)
+        return combined_text, tuple(sources)
+
+    logger.info("Running Tavily search for query: %s", query)
+    raw = _tavily_search(query, top_k)
+
+    text_parts: List[str] = []
+    sources: List[str] = []
+
+    # Normalize result shapes
+    results = []
+    if isinstance(raw, dict):
+        results = raw.get("results") or raw.get("hits") or raw.get("items") or []
+    elif isinstance(raw, list):
+        results = raw
+    else:
+        try:
+            results = list(raw)
+        except Exception:
+            results = []
+
+    for r in results[:top_k]:
+        if not r:
+            continue
+        content = None
+        for k in ("content", "snippet", "text", "summary"):
+            if isinstance(r, dict) and k in r and r[k]:
+                content = r[k]
+                break
+        if content is None and isinstance(r, str):
+            content = r
+        if content:
+            text_parts.append(content)
+
+        url = None
+        if isinstance(r, dict):
+            for k in ("url", "link", "source", "href"):
+                if k in r and r[k]:
+                    url = r[k]
+                    break
+        if url:
+            sources.append(url)
+
+    # dedupe sources, keeping first-seen order
+    deduped_sources = tuple(dict.fromkeys(sources))
+
+    combined_text = "\n\n".join(text_parts).strip()
+    logger.info("Tavily search collected %d chars and %d sources", len(combined_text), len(deduped_sources))
+    if combined_text:
+        _cache.set(cache_key, json.dumps([combined_text, deduped_sources]), ttl=SEARCH_CACHE_TTL, tag=company)
+    return combined_text, deduped_sources
 
 
 class ResearchAgent:
     def __init__(self, text_model: str = GEMINI_TEXT_MODEL):
-        self.tavily = _tavily_client
-        self.client = _genai_client
+        self.client = get_gemini_client()
+        self.cache = _cache
         self.text_model = text_model
 
     def search_company(self, company_name: str, top_k: int = 8) -> Tuple[str, List[str]]:
@@ -35,69 +279,83 @@ class ResearchAgent:
         Perform a Tavily search for the given company name.
         Returns combined_text (concatenated snippets) and a list of source URLs.
         """
-        query = f"{company_name} company overview business model latest news competitors funding"
-        logger.info("Running Tavily search for query: %s", query)
-
         try:
-            raw = self.tavily.search(query=query, limit=top_k, include_raw_content=True)
+            combined_text, sources = _tavily_fetch(company_tag(company_name), top_k)
         except Exception as e:
             logger.exception("Tavily search failed: %s", e)
             return "", []
+        return combined_text, list(sources)
 
-        combined_text = ""
-        sources: List[str] = []
-
-        # Normalize result shapes
-        results = []
-        if isinstance(raw, dict):
-            results = raw.get("results") or raw.get("hits") or raw.get("items") or []
-        elif isinstance(raw, list):
-            results = raw
-        else:
-            try:
-                results = list(raw)
-            except Exception:
-                results = []
-
-        for r in results[:top_k]:
-            if not r:
-                continue
-            content = None
-            for k in ("content", "snippet", "text", "summary"):
-                if isinstance(r, dict) and k in r and r[k]:
-                    content = r[k]
-                    break
-            if content is None and isinstance(r, str):
-                content = r
-            if content:
-                combined_text += content + "\n\n"
-
-            url = None
-            if isinstance(r, dict):
-                for k in ("url", "link", "source", "href"):
-                    if k in r and r[k]:
-                        url = r[k]
-                        break
-            if url:
-                sources.append(url)
+    def invalidate_company(self, company_name: str) -> int:
+        """
+        Drop cached search results and plan sections for a company, forcing a refresh.
+        Returns the number of cache entries removed.
+        """
+        company = company_tag(company_name)
+        with _search_memo_lock:
+            for key in [k for k in _search_memo if k[0] == company]:
+                _search_memo.pop(key, None)
+        removed = self.cache.invalidate(tag=company)
+        logger.info("Removed %d cached entries for %s", removed, company_name)
+        return removed
+
+    def _log_prefix_cache_usage(self, resp: Any) -> None:
+        """
+        Log how much of the prompt Gemini served from its implicit prefix cache.
+        """
+        usage = getattr(resp, "usage_metadata", None)
+        prompt_tokens = getattr(usage, "prompt_token_count", None) or 0
+        if not prompt_tokens:
+            return
+        cached_tokens = getattr(usage, "cached_content_token_count", None) or 0
+        logger.info(
+            "Gemini prefix cache: %d/%d prompt tokens cached (%.0f%%)",
+            cached_tokens, prompt_tokens, 100.0 * cached_tokens / prompt_tokens,
+        )
+
+    def _generation_config(self, structured: bool) -> Optional[Dict[str, Any]]:
+        if not structured:
+            return None
+        return {"response_mime_type": "application/json", "response_schema": ACCOUNT_PLAN_SCHEMA}
+
+    def _stream_gemini(self, prompt: str, on_chunk: Callable[[str], None], structured: bool = False) -> str:
+        """
+        Like _call_gemini, but streams the response and passes each text chunk to
+        on_chunk as it arrives. Falls back to the non-streaming call on errors.
+        """
+        parts = []
+        last = None
+        try:
+            with gemini_semaphore:
+                stream = self.client.models.generate_content_stream(
+                    model=self.text_model, contents=prompt, config=self._generation_config(structured)
+                )
+                for last in stream:
+                    text = getattr(last, "text", None)
+                    if text:
+                        parts.append(text)
+                        on_chunk(text)
+        except Exception as e:
+            logger.exception("Gemini streaming call failed, retrying without streaming: %s", e)
+            return self._call_gemini(prompt, structured=structured)
 
-        # dedupe sources
-        seen = set()
-        deduped_sources = []
-        for s in sources:
-            if s not in seen:
-                deduped_sources.append(s)
-                seen.add(s)
+        if last is not None:
+            self._log_prefix_cache_usage(last)
+        return "".join(parts).strip()
 
-        logger.info("Tavily search collected %d chars and %d sources", len(combined_text), len(deduped_sources))
-        return combined_text.strip(), deduped_sources
+    @retry_on_rate_limit
+    def _generate(self, prompt: str, config: Optional[Dict[str, Any]]) -> Any:
+        with gemini_semaphore:
+            return self.client.models.generate_content(model=self.text_model, contents=prompt, config=config)
 
-    def _call_gemini(self, prompt: str) -> str:
+    def _call_gemini(self, prompt: str, structured: bool = False) -> str:
         """
         Call Gemini via genai client; defensive extraction of text.
+        With structured=True the model is constrained to return ACCOUNT_PLAN_SCHEMA JSON.
         """
+        config = self._generation_config(structured)
         try:
-            resp = self.client.models.generate_content(model=self.text_model, contents=prompt)
+            resp = self._generate(prompt, config)
         except Exception as e:
             logger.exception("Primary genai.models.generate_content failed: %s", e)
             try:
@@ -106,6 +364,8 @@ class ResearchAgent:
                 logger.exception("Fallback genai.generate failed: %s", e2)
                 raise RuntimeError(f"Gemini invocation failed: {e} / {e2}")
 
+        self._log_prefix_cache_usage(resp)
+
         text_output = ""
         # Try common shapes
         if hasattr(resp, "text") and resp.text:
@@ -138,88 +398,150 @@ class ResearchAgent:
 
     def _extract_json_from_text(self, text: str) -> Dict[str, Any]:
         """
-        Attempts to find and parse the first JSON object in text.
+        Parse a JSON object from model output. Structured-output responses are plain
+        JSON; for anything else, find the first balanced {...} block by scanning once.
         """
         if not text:
             return {}
-        m = re.search(r"(\{.*\})", text, flags=re.DOTALL)
-        if m:
-            json_str = m.group(1)
+        try:
+            obj = json.loads(text)
+            return obj if isinstance(obj, dict) else {}
+        except ValueError:
+            pass
+
+        json_str = _first_json_object(text)
+        if json_str is None:
+            return {}
+        try:
+            return json.loads(json_str)
+        except Exception:
+            # try lenient cleanup
             try:
-                return json.loads(json_str)
+                cleaned = _TRAILING_COMMA_ARR.sub("]", _TRAILING_COMMA_OBJ.sub("}", json_str))
+                return json.loads(cleaned)
             except Exception:
-                # try lenient cleanup
-                try:
-                    cleaned = re.sub(r",\s*}", "}", json_str)
-                    cleaned = re.sub(r",\s*\]", "]", cleaned)
-                    return json.loads(cleaned)
-                except Exception:
-                    return {}
-        return {}
+                return {}
+
+    def _expand_one(self, key: str, research_data: str, company_name: str) -> str:
+        """
+        Ask Gemini to write one section as long plain text.
+        """
+        section = key.replace("_", " ")
+        task = f"""
+Write the "{section}" section of the account plan in much more detail.
+
+Produce a long, well-structured plain-text section (not bullet fragments) of about 150-400 words, using the research above. Output ONLY the section text, without a heading, JSON or markdown fences.
+"""
+        return self._call_gemini(_build_prompt(research_data, company_name, task))
 
     def _ensure_long_sections(self, plan: Dict[str, Any], research_data: str, company_name: str) -> Dict[str, Any]:
         """
         If any key in plan is too short (< threshold), ask Gemini to expand those keys
-        and merge expanded text into the plan.
+        and merge expanded text into the plan. Each section is expanded by its own
+        Gemini call; the calls run concurrently, so latency is that of the slowest one.
         """
         MIN_CHARS = 300  # threshold: below this, we expand
-        keys_to_expand = [k for k in ACCOUNT_PLAN_TEMPLATE.keys() if len(str(plan.get(k, "") or "")) < MIN_CHARS]
+        # plan values are already strings here (generate_account_plan normalizes them)
+        keys_to_expand = [k for k in PLAN_SECTION_KEYS if len(plan.get(k) or "") < MIN_CHARS]
         if not keys_to_expand:
+            logger.info("All sections are long enough; skipping expansion")
             return plan
 
         logger.info("Expanding short sections: %s", keys_to_expand)
-        # Build an expand prompt asking only for the specific keys as long text
-        keys_list = ", ".join(keys_to_expand)
-        expand_prompt = f"""
-You are an expert enterprise sales analyst. Expand the following sections into much more detailed content.
-Company: {company_name}
+        return self._expand_sections(plan, keys_to_expand, research_data, company_name)
 
-Sections to expand: {keys_list}
-
-For each requested section, produce a long, well-structured plain-text value (not bullet fragments) of about 150-400 words each, using the research provided. Output ONLY valid JSON with keys exactly matching the section names and values as strings.
-
-Research context (use for evidence):
-{research_data}
-"""
-        expanded_text = self._call_gemini(expand_prompt)
-        expanded_obj = self._extract_json_from_text(expanded_text)
+    def _expand_sections(
+        self, plan: Dict[str, Any], keys_to_expand: List[str], research_data: str, company_name: str
+    ) -> Dict[str, Any]:
+        """
+        (Re)write the given sections concurrently, one Gemini call each, keeping the
+        new text where it is longer than the current value.
+        """
+        workers = min(MAX_PARALLEL_EXPANSIONS, len(keys_to_expand))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {k: pool.submit(self._expand_one, k, research_data, company_name) for k in keys_to_expand}
 
-        # Merge expanded_obj into plan for keys present
-        for k in keys_to_expand:
-            val = expanded_obj.get(k)
-            if val and isinstance(val, str) and len(val.strip()) > len(str(plan.get(k, "") or "")):
+        # Merge expanded text into plan where it is longer than what we had
+        for k, future in futures.items():
+            try:
+                val = future.result()
+            except Exception as e:
+                logger.warning("Expanding section %s failed: %s", k, e)
+                continue
+            if val and isinstance(val, str) and len(val.strip()) > len(plan.get(k) or ""):
                 plan[k] = val.strip()
         return plan
 
-    def generate_account_plan(self, research_data: str, sources: List[str], company_name: str) -> Dict[str, Any]:
+    def generate_account_plan(
+        self,
+        research_data: str,
+        sources: List[str],
+        company_name: str,
+        on_overview: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
         """
         Create a structured account plan from research_data asking for elaborated content.
         Steps:
           1) Ask Gemini to output JSON with detailed multi-paragraph values (~150-400 words each).
           2) If any section is still short, call Gemini again to expand those sections and merge.
+        Sections are cached per company with per-section TTLs (SECTION_CACHE_TTL); re-runs
+        reuse them and only regenerate sections that have expired.
+        If on_overview is given, the synthesis call is streamed and company_overview text
+        is passed to it as it is generated (e.g. to start text-to-speech early).
         """
-        prompt = f"""
-You are an expert enterprise sales analyst. Parse the following research text and produce a JSON object
+        research_data = _compress(research_data)
+        company = company_tag(company_name)
+        cached_sections = {}
+        for k in PLAN_SECTION_KEYS:
+            value = self.cache.get(f"plan:{company}:{k}")
+            if value is not None:
+                cached_sections[k] = value
+
+        if cached_sections:
+            plan = {k: cached_sections.get(k, "") for k in PLAN_SECTION_KEYS}
+            if on_overview is not None and plan["company_overview"]:
+                on_overview(plan["company_overview"])
+            missing = [k for k in PLAN_SECTION_KEYS if k not in cached_sections]
+            if missing:
+                # Only the expired/missing sections are regenerated
+                logger.info("Regenerating expired plan sections for %s: %s", company_name, missing)
+                plan = self._expand_sections(plan, missing, research_data, company_name)
+                self._cache_sections(company, plan, missing)
+                if on_overview is not None and "company_overview" in missing:
+                    on_overview(plan["company_overview"])
+            else:
+                logger.info("Account plan for %s served from cache", company_name)
+            return self._attach_sources(plan, sources)
+
+        task = """
+Parse the research text above and produce a JSON object
 with these keys (exact): company_overview, key_findings, pain_points, opportunities, competitors, recommended_strategy
 
 For EACH key produce a detailed, multi-paragraph, well-written section (aim for ~150-400 words per section).
-Use evidence from the research. Where helpful, include brief inline citations in parentheses (e.g., 'According to [source]...').
 
 Important:
 - Output ONLY valid JSON (no explanatory text). Each value must be a plain string (you may include newlines).
 - Keep JSON parsable (avoid trailing commas).
-
-Company: {company_name}
-
-Research:
-{research_data}
 """
         logger.info("Calling Gemini to synthesize detailed account plan for %s", company_name)
-        text_output = self._call_gemini(prompt)
+        prompt = _build_prompt(research_data, company_name, task)
+        overview_stream = None
+        if on_overview is None:
+            text_output = self._call_gemini(prompt, structured=True)
+        else:
+            overview_stream = _StreamedStringField("company_overview")
+
+            def on_chunk(chunk: str) -> None:
+                text = overview_stream.feed(chunk)
+                if text:
+                    on_overview(text)
+
+            text_output = self._stream_gemini(prompt, on_chunk, structured=True)
 
         parsed_obj = self._extract_json_from_text(text_output)
 
-        if not isinstance(parsed_obj, dict) or not any(parsed_obj.values()):
+        parsed_ok = isinstance(parsed_obj, dict) and any(parsed_obj.values())
+        if not parsed_ok:
             # fallback: put raw model text into company_overview (but ideally won't happen)
             logger.warning("Gemini did not return valid JSON. Falling back to raw text.")
             parsed_obj = {
@@ -238,10 +560,30 @@ Research:
 
         # If any section is still short, request expansion and merge
         plan = self._ensure_long_sections(plan, research_data, company_name)
+        if overview_stream is not None and not overview_stream.done:
+            # the stream never finished the overview (non-JSON output, or the stream failed
+            # and the non-streaming call took over), so hand over the part not yet delivered
+            rest = plan["company_overview"][overview_stream.decoded_chars:]
+            if rest:
+                on_overview(rest)
+
+        if parsed_ok:
+            self._cache_sections(company, plan, PLAN_SECTION_KEYS)
+
+        plan = self._attach_sources(plan, sources)
+        logger.info("Generated detailed account plan with keys: %s", list(plan.keys()))
+        return plan
 
+    def _cache_sections(self, company: str, plan: Dict[str, Any], keys: List[str]) -> None:
+        """
+        Store each non-empty section under its own key and TTL, tagged with the company.
+        """
+        for k in keys:
+            if plan.get(k):
+                self.cache.set(f"plan:{company}:{k}", plan[k], ttl=SECTION_CACHE_TTL[k], tag=company)
+
+    def _attach_sources(self, plan: Dict[str, Any], sources: List[str]) -> Dict[str, Any]:
         # Attach sources and confidence estimate
         plan["sources"] = sources or []
         plan["confidence_estimate"] = f"{min(95, 20 + 10 * len(plan['sources']))}%"
-
-        logger.info("Generated detailed account plan with keys: %s", list(plan.keys()))
         return plan
@@ -0,0 +1,122 @@
+# agent/semantic_cache.py
+"""
+SemanticCache: remembers answers per account plan and serves them again for
+repeated or paraphrased questions. Exact (normalized) questions are looked up
+in a dict; everything else is matched by cosine similarity of question embeddings.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Similarity >= HIT_THRESHOLD is served from cache. Between GRAY_THRESHOLD and
+# HIT_THRESHOLD the question is "probably the same" but we still ask the model
+# (and cache the fresh answer), so a near miss never returns a wrong answer.
+HIT_THRESHOLD = 0.92
+GRAY_THRESHOLD = 0.80
+
+
+def plan_hash(plan: Dict[str, Any], keys: Iterable[str]) -> str:
+    """
+    Stable hash of the plan fields that feed the answer prompt.
+    Only used as an in-process dict key, so a 64-bit blake2b digest is enough.
+    """
+    payload = json.dumps({k: plan.get(k, "") for k in keys}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _normalize_question(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+class SemanticCache:
+    def __init__(
+        self,
+        hit_threshold: float = HIT_THRESHOLD,
+        gray_threshold: float = GRAY_THRESHOLD,
+        max_plans: int = 128,
+        max_entries_per_plan: int = 256,
+    ):
+        self.hit_threshold = hit_threshold
+        self.gray_threshold = gray_threshold
+        self.max_plans = max_plans
+        self.max_entries_per_plan = max_entries_per_plan
+        self._exact: Dict[str, Dict[str, str]] = {}
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._answers: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def get_exact(self, plan_key: str, question: str) -> Optional[str]:
+        """
+        Return the cached answer for the same (normalized) question, if any.
+        """
+        with self._lock:
+            return self._exact.get(plan_key, {}).get(_normalize_question(question))
+
+    def lookup(self, plan_key: str, embedding: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        Find the most similar cached question for this plan.
+        Returns (answer, similarity); answer is None unless similarity >= hit_threshold.
+        """
+        with self._lock:
+            vectors = self._vectors.get(plan_key)
+            if vectors is None or not len(vectors):
+                return None, 0.0
+            sims = vectors @ embedding
+            best = int(np.argmax(sims))
+            sim = float(sims[best])
+            if sim >= self.hit_threshold:
+                return self._answers[plan_key][best], sim
+        if sim >= self.gray_threshold:
+            logger.info("Semantic cache gray zone (similarity %.3f); asking the model", sim)
+        return None, sim
+
+    def add(self, plan_key: str, question: str, embedding: Optional[np.ndarray], answer: str) -> None:
+        """
+        Store an answer for exact lookups and, when an embedding is available, for similarity lookups.
+        """
+        with self._lock:
+            if plan_key not in self._exact and len(self._exact) >= self.max_plans:
+                # dicts keep insertion order, so the first key is the oldest plan
+                oldest = next(iter(self._exact))
+                self._exact.pop(oldest, None)
+                self._vectors.pop(oldest, None)
+                self._answers.pop(oldest, None)
+
+            exact = self._exact.setdefault(plan_key, {})
+            normalized = _normalize_question(question)
+            if normalized not in exact and len(exact) >= self.max_entries_per_plan:
+                exact.pop(next(iter(exact)))  # oldest question for this plan
+            exact[normalized] = answer
+            if embedding is None:
+                return
+
+            vectors = self._vectors.get(plan_key)
+            answers = self._answers.setdefault(plan_key, [])
+            row = embedding.reshape(1, -1)
+            if vectors is None or vectors.shape[1] != row.shape[1]:
+                vectors = row
+                answers[:] = [answer]
+            else:
+                vectors = np.vstack([vectors, row])[-self.max_entries_per_plan:]
+                answers.append(answer)
+                del answers[:-self.max_entries_per_plan]
+            self._vectors[plan_key] = vectors
+
+
+def normalize_embedding(values: Any) -> Optional[np.ndarray]:
+    """
+    Convert raw embedding values to a unit-length float32 vector (so dot product == cosine).
+    """
+    vec = np.asarray(values, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if not vec.size or norm == 0.0:
+        return None
+    return vec / norm
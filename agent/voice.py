@@ -1,42 +1,55 @@
 # agent/voice.py
-import os
-import tempfile
-import sounddevice as sd
-import soundfile as sf
-import pyttsx3
+import io
+import queue
+import re
+import threading
 
-from google import genai
-from config import GEMINI_API_KEY, GEMINI_AUDIO_MODEL
+from agent.clients import get_gemini_client
+from config import GEMINI_AUDIO_MODEL
 
-# Initialize GenAI client
-genai_client = genai.Client(api_key=GEMINI_API_KEY)
 AUDIO_MODEL = GEMINI_AUDIO_MODEL
 
 def record_audio(duration_seconds=5, samplerate=16000, channels=1):
-    """Record audio for duration_seconds and return local filepath."""
+    """Record audio for duration_seconds and return it as in-memory WAV bytes."""
     try:
         duration = float(duration_seconds)
     except Exception:
         duration = 5.0
     samplerate = int(samplerate)
-    fd, path = tempfile.mkstemp(suffix=".wav")
-    os.close(fd)
+    # Imported here so text-only use of this module doesn't pay for PortAudio/libsndfile init
+    import sounddevice as sd
+    import soundfile as sf
+
+    buf = io.BytesIO()
     print(f"[voice] Recording {duration}s — please speak now...")
-    recording = sd.rec(int(duration * samplerate), samplerate=samplerate, channels=channels, dtype='int16')
-    sd.wait()
-    sf.write(path, recording, samplerate, subtype='PCM_16')
-    print(f"[voice] Saved recording to {path}")
-    return path
+    # Frames are written into the in-memory WAV as they are captured
+    with sf.SoundFile(buf, mode="w", samplerate=samplerate, channels=channels, subtype="PCM_16", format="WAV") as wav:
+        def on_audio(indata, frames, time_info, status):
+            wav.write(indata)
+
+        with sd.InputStream(samplerate=samplerate, channels=channels, dtype="int16", callback=on_audio):
+            sd.sleep(int(duration * 1000))
+    audio = buf.getvalue()
+    print(f"[voice] Recorded {len(audio)} bytes")
+    return audio
 
-def transcribe_audio(filepath, model=AUDIO_MODEL):
+def transcribe_audio(audio, model=AUDIO_MODEL):
     """
-    Transcribes audio file using Gemini (via google-genai).
+    Transcribes audio using Gemini (via google-genai).
+    `audio` is either raw audio bytes (e.g. from record_audio) or a path to an audio file.
     Uses the audio understanding/transcription capability.
     """
     try:
-        # The google-genai SDK supports audio transcription; method names vary by version.
-        # Common usage (based on examples): client.audio.transcribe(file=..., model=...)
-        with open(filepath, "rb") as audio_file:
+        genai_client = get_gemini_client()
+        # Paths are opened and handed over as a file handle, so uploads are read
+        # from disk rather than loaded into memory first.
+        if isinstance(audio, (bytes, bytearray)):
+            audio_file = io.BytesIO(audio)
+        else:
+            audio_file = open(audio, "rb")
+        with audio_file:
+            # The google-genai SDK supports audio transcription; method names vary by version.
+            # Common usage (based on examples): client.audio.transcribe(file=..., model=...)
             try:
                 # Preferred high-level API if available
                 resp = genai_client.audio.transcribe(model=model, file=audio_file)
@@ -50,6 +63,7 @@ def transcribe_audio(filepath, model=AUDIO_MODEL):
                 # Some SDKs accept 'input_content' or 'contents' that include audio bytes.
                 try:
                     # Example using models.generate_content with audio as payload
+                    audio_file.seek(0)
                     audio_bytes = audio_file.read()
                     response = genai_client.models.generate_content(
                         model=model,
@@ -65,12 +79,77 @@ def transcribe_audio(filepath, model=AUDIO_MODEL):
         print(f"[voice] Transcription failed: {e}")
         return ""
 
-def speak_text(text):
-    """Speak text using pyttsx3 (offline)."""
-    try:
-        engine = pyttsx3.init()
-        engine.setProperty('rate', 160)
-        engine.say(text)
-        engine.runAndWait()
-    except Exception as e:
-        print(f"[voice] TTS failed: {e}")
+# pyttsx3 drivers are thread-affine (SAPI5 needs COM initialized on the calling
+# thread, NSSS its run loop), so one long-lived thread creates the engine and does
+# all speaking; everyone else only puts text on its queue.
+_TTS_QUEUE = queue.Queue()
+_TTS_THREAD = None
+_TTS_THREAD_LOCK = threading.Lock()
+
+def _tts_worker():
+    engine = None
+    while True:
+        text, done = _TTS_QUEUE.get()
+        try:
+            if engine is None:
+                import pyttsx3  # imported on first use; probing TTS drivers is slow
+                engine = pyttsx3.init()
+                engine.setProperty('rate', 160)
+            engine.say(text)
+            engine.runAndWait()
+        except Exception as e:
+            print(f"[voice] TTS failed: {e}")
+        finally:
+            done.set()
+
+def speak_text(text, wait=True):
+    """
+    Speak text using pyttsx3 (offline) on the TTS thread.
+    Blocks until it has been spoken unless wait=False; returns an Event set when done.
+    """
+    global _TTS_THREAD
+    with _TTS_THREAD_LOCK:
+        if _TTS_THREAD is None:
+            _TTS_THREAD = threading.Thread(target=_tts_worker, name="tts", daemon=True)
+            _TTS_THREAD.start()
+    done = threading.Event()
+    _TTS_QUEUE.put((text, done))
+    if wait:
+        done.wait()
+    return done
+
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class SentenceSpeaker:
+    """
+    Speaks text one sentence at a time, as it is fed in, via the TTS thread.
+    Lets speech start while the rest of the text is still being generated.
+    """
+
+    def __init__(self, max_chars=None):
+        self._buffer = ""
+        self._remaining = max_chars
+        self._last = None
+
+    def feed(self, text):
+        """Add text; every complete sentence is queued for speaking."""
+        if self._remaining is not None:
+            text = text[:self._remaining]
+            self._remaining -= len(text)
+        if not text:
+            return
+        self._buffer += text
+        *sentences, self._buffer = _SENTENCE_END.split(self._buffer)
+        for sentence in sentences:
+            if sentence.strip():
+                self._last = speak_text(sentence, wait=False)
+
+    def close(self):
+        """Speak whatever is left and wait until speaking has finished."""
+        if self._buffer.strip():
+            self._last = speak_text(self._buffer, wait=False)
+        self._buffer = ""
+        if self._last is not None:
+            self._last.wait()
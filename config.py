@@ -11,3 +11,9 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 # Optional: change model names as per your account access
 GEMINI_TEXT_MODEL = os.getenv("GEMINI_TEXT_MODEL", "gemini-2.5-flash")
 GEMINI_AUDIO_MODEL = os.getenv("GEMINI_AUDIO_MODEL", "gemini-1.5-pro")
+GEMINI_EMBED_MODEL = os.getenv("GEMINI_EMBED_MODEL", "text-embedding-004")
+# Max characters of research text sent to Gemini per prompt
+RESEARCH_CHAR_BUDGET = int(os.getenv("RESEARCH_CHAR_BUDGET", "12000"))
+
+# Local cache for Tavily results and generated plans
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "research_cache.sqlite3"))
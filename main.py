@@ -1,7 +1,8 @@
 # main.py
+import argparse
+
 from agent.research_agent import ResearchAgent
 from agent.plan_editor import PlanEditor
-from agent import voice as voice_mod
 
 def display_plan(plan):
     print("\n===== GENERATED ACCOUNT PLAN =====")
@@ -16,17 +17,22 @@ def display_plan(plan):
     print("\n================================\n")
 
 def run_text_flow():
+    from agent import voice as voice_mod
+
     agent = ResearchAgent()
     editor = PlanEditor()
 
     company = input("Enter company name: ").strip()
     print("\nResearching... please wait...\n")
     research_data, sources = agent.search_company(company)
-    plan = agent.generate_account_plan(research_data, sources, company)
+    # Start reading the overview aloud while the rest of the plan is generated
+    speaker = voice_mod.SentenceSpeaker(max_chars=800)
+    speaker.feed(f"Here is the account plan for {company}. ")
+    plan = agent.generate_account_plan(research_data, sources, company, on_overview=speaker.feed)
     display_plan(plan)
 
     print("Reading the plan aloud...")
-    voice_mod.speak_text(f"Here is the account plan for {company}. {plan.get('company_overview','')[:800]}")
+    speaker.close()
 
     while True:
         choice = input("\nDo you want to edit any section? (yes/no): ").lower()
@@ -36,19 +42,22 @@ def run_text_flow():
         new_text = input("Enter new content: ")
         result = editor.edit_section(plan, section, new_text)
         print(result)
+
     print("\nFinal Plan:")
     display_plan(plan)
     print("Reading final plan aloud...")
     voice_mod.speak_text(f"Final account plan for {company}. {plan.get('company_overview','')[:800]}")
 
 def run_voice_flow():
+    from agent import voice as voice_mod
+
     agent = ResearchAgent()
     editor = PlanEditor()
 
     dur = input("How many seconds to record the company name? (default 4): ").strip()
     dur = float(dur) if dur else 4.0
-    audio_path = voice_mod.record_audio(duration_seconds=dur)
-    company_text = voice_mod.transcribe_audio(audio_path)
+    audio = voice_mod.record_audio(duration_seconds=dur)
+    company_text = voice_mod.transcribe_audio(audio)
     if not company_text:
         print("Could not transcribe audio. Try again or use text mode.")
         return
@@ -62,12 +71,13 @@ def run_voice_flow():
     company = company_text.strip()
     print("\nResearching... please wait...\n")
     research_data, sources = agent.search_company(company)
-    plan = agent.generate_account_plan(research_data, sources, company)
+    speaker = voice_mod.SentenceSpeaker()
+    speaker.feed(f"Here is the account plan for {company}. ")
+    plan = agent.generate_account_plan(research_data, sources, company, on_overview=speaker.feed)
     display_plan(plan)
 
     print("Reading the plan aloud now...")
-    chunk = f"Here is the account plan for {company}. {plan.get('company_overview','')}"
-    voice_mod.speak_text(chunk)
+    speaker.close()
 
     while True:
         resp = input("\nDo you want to edit a section by voice? (yes/no): ").lower()
@@ -77,8 +87,8 @@ def run_voice_flow():
         sec_dur = input("How many seconds to record the new content? (default 6): ").strip()
         sec_dur = float(sec_dur) if sec_dur else 6.0
         print(f"Recording new content for section '{section}'...")
-        a_path = voice_mod.record_audio(duration_seconds=sec_dur)
-        new_text = voice_mod.transcribe_audio(a_path)
+        edit_audio = voice_mod.record_audio(duration_seconds=sec_dur)
+        new_text = voice_mod.transcribe_audio(edit_audio)
         if not new_text:
             print("Could not transcribe edit audio. Try again.")
             continue
@@ -97,6 +107,13 @@ def run_voice_flow():
     voice_mod.speak_text(f"Final account plan for {company}. {plan.get('company_overview','')}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Company Research Assistant")
+    parser.add_argument("--refresh", metavar="COMPANY", help="discard cached research and plan sections for COMPANY first")
+    args = parser.parse_args()
+    if args.refresh:
+        removed = ResearchAgent().invalidate_company(args.refresh)
+        print(f"Cleared {removed} cached entries for {args.refresh}.")
+
     print("Company Research Assistant — choose mode:")
     print("1) Text chat mode")
     print("2) Voice mode (record + TTS)")
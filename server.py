@@ -1,89 +1,345 @@
 # server.py
+import asyncio
+import hashlib
 import logging
+import io
 import json
 from tempfile import NamedTemporaryFile
-from typing import Dict, Any
-import io
+from typing import Dict, Any, Optional
 import os
-from datetime import datetime
+import re
+import shutil
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
 
 from fastapi import FastAPI, Request, UploadFile, File
+from fastapi.routing import APIRoute
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
+from cachetools import LRUCache, TTLCache
+import msgpack
+import orjson
 import uvicorn
 
-from agent.research_agent import ResearchAgent
+from agent.research_agent import ResearchAgent, company_tag
 from agent.plan_editor import PlanEditor
-from agent import voice as voice_mod
-
-# reportlab
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib import colors
-from reportlab.lib.utils import ImageReader
 
 logger = logging.getLogger("server")
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI(title="Company Research Assistant API")
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse serialized with orjson (faster than the stdlib encoder on large plans).
+    FastAPI's own ORJSONResponse is deprecated, so we keep this small subclass.
+    """
+
+    # numpy scalars/arrays and non-str dict keys serialize natively; any other
+    # unknown type falls back to str() instead of failing the response
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self.options, default=str)
+
+
+class ORJSONRequest(Request):
+    """
+    Request whose JSON body is parsed with orjson; FastAPI reads bodies via request.json().
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    def get_route_handler(self):
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request):
+            return await original_handler(ORJSONRequest(request.scope, request.receive))
+
+        return handler
+
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves already-compressed responses (the PDF export) alone.
+    """
+
+    skip_paths = frozenset({"/api/export_pdf"})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app = FastAPI(title="Company Research Assistant API", default_response_class=ORJSONResponse)
+app.router.route_class = ORJSONRoute
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["POST", "GET", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,  # let browsers reuse preflight results for a day
 )
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=5)
 
 research_agent = ResearchAgent()
 editor = PlanEditor()
+_chat_agent = None
+
+
+def _get_chat_agent():
+    """
+    Import and create the ChatAgent on first use (lazy load), then reuse it so its
+    per-plan prompt context is cached across chat requests.
+    """
+    global _chat_agent
+    if _chat_agent is None:
+        from agent.chat_agent import ChatAgent
+        _chat_agent = ChatAgent()
+    return _chat_agent
+
+# Finished plans keyed by normalized company name, plus one lock per company being
+# researched, so repeated or concurrent "Research Tesla" / "tesla" requests share a
+# single research run.
+_PLAN_CACHE: TTLCache = TTLCache(maxsize=512, ttl=900)
+_INFLIGHT: Dict[str, asyncio.Lock] = {}
+
+
+def _run_research(company: str) -> Dict[str, Any]:
+    research_text, sources = research_agent.search_company(company)
+    return research_agent.generate_account_plan(research_text, sources, company)
+
+
+async def _get_plan(key: str, company: str) -> Dict[str, Any]:
+    """
+    Return the cached plan for key (the normalized company name), or research
+    company once while other requests for the same key wait.
+    """
+    plan = _PLAN_CACHE.get(key)
+    if plan is not None:
+        return plan
+
+    lock = _INFLIGHT.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            plan = _PLAN_CACHE.get(key)
+            if plan is None:
+                plan = await run_in_threadpool(_run_research, company)
+                _PLAN_CACHE[key] = plan
+    finally:
+        if not lock.locked() and _INFLIGHT.get(key) is lock:
+            del _INFLIGHT[key]
+    return plan
+
+
+# "Research X" -> "X"; only a whole leading word, so "ResearchGate" is left alone
+_RESEARCH_PREFIX = re.compile(r"research(?:\s+|$)", re.IGNORECASE)
+
+# every byte value except A-Z / a-z; deleting these leaves only ASCII letters
+_NON_ASCII_LETTERS = bytes(b for b in range(256) if not (65 <= b <= 90 or 97 <= b <= 122))
+
+UPLOAD_CHUNK_SIZE = 1 << 20
 
 # optional logo path
 LOGO_PATH = os.path.join(os.path.dirname(__file__), "static", "logo.png")
 
 
+def _load_logo() -> Optional[bytes]:
+    """
+    Read and validate the logo once; returns None if it is missing or unreadable.
+    """
+    from reportlab.lib.utils import ImageReader
+
+    if not os.path.exists(LOGO_PATH):
+        return None
+    try:
+        with open(LOGO_PATH, "rb") as f:
+            data = f.read()
+        ImageReader(io.BytesIO(data)).getSize()
+        return data
+    except Exception as e:
+        logger.warning("Ignoring unreadable logo %s: %s", LOGO_PATH, e)
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_reportlab() -> SimpleNamespace:
+    """
+    Import reportlab on the first PDF export (lazy load) and build the shared
+    styles and logo bytes once; later exports reuse the same namespace.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+    from reportlab.lib import colors
+
+    styles = getSampleStyleSheet()
+    return SimpleNamespace(
+        A4=A4,
+        mm=mm,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        Table=Table,
+        Image=Image,
+        title_style=ParagraphStyle(
+            "Title",
+            parent=styles["Title"],
+            fontName="Helvetica-Bold",
+            fontSize=18,
+            leading=22,
+            spaceAfter=8
+        ),
+        heading_style=ParagraphStyle(
+            "Heading",
+            parent=styles["Heading2"],
+            fontName="Helvetica-Bold",
+            fontSize=12,
+            leading=14,
+            spaceBefore=8,
+            spaceAfter=6
+        ),
+        body_style=ParagraphStyle(
+            "Body",
+            parent=styles["BodyText"],
+            fontName="Helvetica",
+            fontSize=11,
+            leading=15,
+            spaceAfter=6
+        ),
+        small_style=ParagraphStyle(
+            "Small",
+            parent=styles["BodyText"],
+            fontName="Helvetica-Oblique",
+            fontSize=9,
+            leading=11,
+            textColor=colors.HexColor("#555555"),
+            spaceAfter=4
+        ),
+        header_tbl_style=TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ]),
+        sources_tbl_style=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#f0f0f0")),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor("#333333")),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor("#DDDDDD")),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('LEFTPADDING', (0,0), (-1,-1), 6),
+            ('RIGHTPADDING', (0,0), (-1,-1), 6),
+        ]),
+        # reportlab's Image flowable takes a path or file object (not an ImageReader),
+        # so keep the bytes in memory and hand each export its own BytesIO.
+        logo_bytes=_load_logo(),
+    )
+
+
+# Paragraph text is parsed as reportlab mini-XML, so stray "<" or "&" in model output
+# must be escaped (an unmatched tag makes the whole export fail). Table cells holding
+# plain strings are not parsed and are left as they are.
+_XML_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_PARA_SPLIT = re.compile(r"\r?\n\r?\n")
+_SINGLE_NL = re.compile(r"\r?\n")
+
+# at most MAX_PDF_SOURCES sources are listed in the PDF, numbered from _NUMS
+MAX_PDF_SOURCES = 150
+_NUMS = [str(i) for i in range(1, MAX_PDF_SOURCES + 1)]
+
+# reportlab renders are CPU-bound; allow about one per core so bursts queue here
+# instead of starving the threadpool used by the other endpoints
+_PDF_SEM = asyncio.Semaphore(os.cpu_count() or 2)
+
+# rendered PDFs keyed by a hash of the plan, so re-downloading an unchanged plan skips reportlab
+_PDF_CACHE: LRUCache = LRUCache(maxsize=64)
+
+
+def _error_response(content: Dict[str, Any], status_code: int = 400) -> Response:
+    return Response(content=orjson.dumps(content), status_code=status_code, media_type="application/json")
+
+
+# Fixed client errors are serialized once; a Response is not modified while it is sent,
+# so the same instance can be returned to every request.
+_ERR_MISSING_QUERY = _error_response({"error": "missing_query"})
+_ERR_INVALID_INPUT = _error_response({
+    "error": "invalid_input",
+    "detail": "Invalid input — please enter a valid company name or research query (e.g., 'Research Tesla' or 'Research EightFold AI')."
+})
+_ERR_PLAN_AND_SECTION_REQUIRED = _error_response({"error": "plan_and_section_required"})
+_ERR_PLAN_REQUIRED = _error_response({"error": "plan_required"})
+_ERR_MISSING_QUESTION = _error_response({"error": "missing_question"})
+_ERR_MISSING_PLAN = _error_response({"error": "missing_plan"})
+
+
+def _msgpack_default(obj: Any) -> Any:
+    # accept what ORJSONResponse accepts: numpy scalars/arrays natively, anything else as str
+    return obj.tolist() if hasattr(obj, "tolist") else str(obj)
+
+
+def _negotiated_response(request: Request, content: Dict[str, Any]) -> Response:
+    """
+    msgpack for callers that ask for it (Accept: application/msgpack), JSON for everyone else.
+    """
+    if "application/msgpack" in request.headers.get("accept", ""):
+        return Response(content=msgpack.packb(content, use_bin_type=True, default=_msgpack_default), media_type="application/msgpack")
+    return ORJSONResponse(status_code=200, content=content)
+
+
+def _pdf_response(data: bytes, filename: str) -> Response:
+    # reportlab emits the whole file at once, so send it as a single body;
+    # Response sets Content-Length from it, unlike chunked StreamingResponse
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    return Response(content=data, media_type="application/pdf", headers=headers)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.exception("Unhandled exception for request %s: %s", request.url, exc)
-    return JSONResponse(status_code=500, content={"error": "internal_server_error", "detail": str(exc)})
+    return ORJSONResponse(status_code=500, content={"error": "internal_server_error", "detail": str(exc)})
 
 
 @app.post("/api/research")
-async def api_research(payload: Dict[str, Any]):
+async def api_research(payload: Dict[str, Any], request: Request):
     try:
         query = payload.get("query") if isinstance(payload, dict) else None
         if not query:
-            return JSONResponse(status_code=400, content={"error": "missing_query"})
+            return _ERR_MISSING_QUERY
 
         # --- Lightweight input validation (non-invasive) ---
         # Remove a leading 'research' keyword so users who type "Research X" still pass.
         cleaned = str(query).strip()
-        if cleaned.lower().startswith("research"):
-            candidate = cleaned[len("research"):].strip()
-        else:
-            candidate = cleaned
+        prefix = _RESEARCH_PREFIX.match(cleaned)
+        candidate = cleaned[prefix.end():] if prefix else cleaned
 
-        # Count alphabetic characters in the candidate (basic heuristic).
+        # Count ASCII letters in the candidate (basic heuristic).
         # If there are too few letters, treat it as invalid input (e.g., "1234!!!!").
-        import re
-        letters_count = len(re.findall(r"[A-Za-z]", candidate))
+        letters_count = len(candidate.encode("ascii", "ignore").translate(None, _NON_ASCII_LETTERS))
         if letters_count < 3:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "invalid_input",
-                    "detail": "Invalid input — please enter a valid company name or research query (e.g., 'Research Tesla' or 'Research EightFold AI')."
-                }
-            )
+            return _ERR_INVALID_INPUT
         # -------------------------------------------------------
 
-        research_text, sources = research_agent.search_company(query)
-        plan = research_agent.generate_account_plan(research_text, sources, query)
-        return JSONResponse(status_code=200, content={"plan": plan})
+        # research the name as the user typed it; its normalized tag is the cache key,
+        # the same tag ResearchAgent uses (so `main.py --refresh` reaches the same entries)
+        company = " ".join(candidate.split())
+        plan = await _get_plan(company_tag(company), company)
+        return _negotiated_response(request, {"plan": plan})
     except Exception as e:
         logger.exception("api_research failed: %s", e)
-        return JSONResponse(status_code=500, content={"error": "api_research_failed", "detail": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": "api_research_failed", "detail": str(e)})
 
 
 
@@ -94,27 +350,35 @@ async def api_edit(payload: Dict[str, Any]):
         section = payload.get("section")
         content = payload.get("content")
         if not plan or not section:
-            return JSONResponse(status_code=400, content={"error": "plan_and_section_required"})
+            return _ERR_PLAN_AND_SECTION_REQUIRED
         msg = editor.edit_section(plan, section, content)
-        return JSONResponse(status_code=200, content={"ok": True, "message": msg, "plan": plan})
+        return ORJSONResponse(status_code=200, content={"ok": True, "message": msg, "plan": plan})
     except Exception as e:
         logger.exception("api_edit failed: %s", e)
-        return JSONResponse(status_code=500, content={"error": "api_edit_failed", "detail": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": "api_edit_failed", "detail": str(e)})
 
 
 @app.post("/api/transcribe")
 async def api_transcribe(file: UploadFile = File(...)):
+    tmp_path = None
     try:
+        # copy the upload to disk in 1 MiB chunks rather than holding the whole blob in memory
         with NamedTemporaryFile(delete=False, suffix=".webm") as tf:
-            data = await file.read()
-            tf.write(data)
             tmp_path = tf.name
+            await run_in_threadpool(shutil.copyfileobj, file.file, tf, UPLOAD_CHUNK_SIZE)
 
-        text = voice_mod.transcribe_audio(tmp_path)
-        return JSONResponse(status_code=200, content={"text": text or ""})
+        from agent import voice as voice_mod
+        text = await run_in_threadpool(voice_mod.transcribe_audio, tmp_path)
+        return ORJSONResponse(status_code=200, content={"text": text or ""})
     except Exception as e:
         logger.exception("api_transcribe failed: %s", e)
-        return JSONResponse(status_code=500, content={"error": "transcription_failed", "detail": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": "transcription_failed", "detail": str(e)})
+    finally:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                logger.warning("Could not remove temp file %s", tmp_path)
 
 
 @app.post("/api/export_pdf")
@@ -126,14 +390,31 @@ async def api_export_pdf(payload: Dict[str, Any]):
     try:
         plan = payload.get("plan")
         if not plan or not isinstance(plan, dict):
-            return JSONResponse(status_code=400, content={"error": "plan_required"})
+            return _ERR_PLAN_REQUIRED
 
+        # same plan -> same PDF; sorted keys give equal dicts the same bytes
+        filename = payload.get("filename") or "account_plan.pdf"
+        cache_key = hashlib.blake2b(orjson.dumps(plan, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+        cached = _PDF_CACHE.get(cache_key)
+        if cached is not None:
+            return _pdf_response(cached, filename)
+
+        pget = plan.get
+        overview, findings, pains, opps, comps, strat, conf = (
+            pget(k) or "" for k in (
+                "company_overview", "key_findings", "pain_points", "opportunities",
+                "competitors", "recommended_strategy", "confidence_estimate",
+            )
+        )
+        sources = (pget("sources") or [])[:MAX_PDF_SOURCES]
+
+        rl = _get_reportlab()
         buffer = io.BytesIO()
-        pagesize = A4
-        left_margin = right_margin = 20 * mm
-        top_margin = bottom_margin = 20 * mm
+        pagesize = rl.A4
+        left_margin = right_margin = 20 * rl.mm
+        top_margin = bottom_margin = 20 * rl.mm
 
-        doc = SimpleDocTemplate(
+        doc = rl.SimpleDocTemplate(
             buffer,
             pagesize=pagesize,
             leftMargin=left_margin,
@@ -144,140 +425,81 @@ async def api_export_pdf(payload: Dict[str, Any]):
             author="Company Research Agent"
         )
 
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            "Title",
-            parent=styles["Title"],
-            fontName="Helvetica-Bold",
-            fontSize=18,
-            leading=22,
-            spaceAfter=8
-        )
-        heading_style = ParagraphStyle(
-            "Heading",
-            parent=styles["Heading2"],
-            fontName="Helvetica-Bold",
-            fontSize=12,
-            leading=14,
-            spaceBefore=8,
-            spaceAfter=6
-        )
-        body_style = ParagraphStyle(
-            "Body",
-            parent=styles["BodyText"],
-            fontName="Helvetica",
-            fontSize=11,
-            leading=15,
-            spaceAfter=6
-        )
-        small_style = ParagraphStyle(
-            "Small",
-            parent=styles["BodyText"],
-            fontName="Helvetica-Oblique",
-            fontSize=9,
-            leading=11,
-            textColor=colors.HexColor("#555555"),
-            spaceAfter=4
-        )
-
         story = []
 
         # Header: optional logo + title + date
         # If logo exists, show on left; title on right.
-        if os.path.exists(LOGO_PATH):
+        if rl.logo_bytes is not None:
             try:
-                logo = ImageReader(LOGO_PATH)
-                im = Image(LOGO_PATH, width=50, height=50)
+                im = rl.Image(io.BytesIO(rl.logo_bytes), width=50, height=50)
                 # place logo + title using a small table
                 header_tbl = [
-                    [im, Paragraph(f"<b>Account Plan</b><br/><font size=10>{(plan.get('company_overview') or '')[:80]}</font>")]
+                    [im, rl.Paragraph(f"<b>Account Plan</b><br/><font size=10>{overview[:80].translate(_XML_TRANS)}</font>")]
                 ]
-                tbl = Table(header_tbl, colWidths=[50, doc.width - 50])
-                tbl.setStyle(TableStyle([
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ]))
+                tbl = rl.Table(header_tbl, colWidths=[50, doc.width - 50])
+                tbl.setStyle(rl.header_tbl_style)
                 story.append(tbl)
-                story.append(Spacer(1, 10))
+                story.append(rl.Spacer(1, 10))
             except Exception:
                 # fallback to plain title
-                story.append(Paragraph("Account Plan", title_style))
+                story.append(rl.Paragraph("Account Plan", rl.title_style))
         else:
-            story.append(Paragraph("Account Plan", title_style))
+            story.append(rl.Paragraph("Account Plan", rl.title_style))
 
         # metadata line
-        gen_date = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
-        story.append(Paragraph(f"Generated: {gen_date}", small_style))
-        if plan.get("confidence_estimate"):
-            story.append(Paragraph(f"Confidence estimate: {plan.get('confidence_estimate')}", small_style))
-        story.append(Spacer(1, 8))
+        story.append(rl.Paragraph(f"Generated: {datetime.now(timezone.utc):%Y-%m-%d %H:%M} UTC", rl.small_style))
+        if conf:
+            story.append(rl.Paragraph(f"Confidence estimate: {str(conf).translate(_XML_TRANS)}", rl.small_style))
+        story.append(rl.Spacer(1, 8))
 
         # Helper to split text into paragraphs
         def add_long_text_as_paragraphs(title, text):
-            story.append(Paragraph(title, heading_style))
+            story.append(rl.Paragraph(title, rl.heading_style))
             if not text or not str(text).strip():
-                story.append(Paragraph("<i>Not available</i>", small_style))
-                story.append(Spacer(1, 6))
+                story.append(rl.Paragraph("<i>Not available</i>", rl.small_style))
+                story.append(rl.Spacer(1, 6))
                 return
-            # normalize and split on double newlines, keep lines wrapped
-            txt = str(text).strip()
-            # Replace Windows CRLF
-            txt = txt.replace("\r\n", "\n")
-            paras = [p.strip() for p in txt.split("\n\n") if p.strip()]
-            for p in paras:
-                # replace single newlines inside paragraph with <br/>
-                safe = p.replace("\n", "<br/>")
-                story.append(Paragraph(safe, body_style))
-            story.append(Spacer(1, 6))
+            # split on blank lines (LF or CRLF); single newlines inside a paragraph become <br/>
+            for p in _PARA_SPLIT.split(str(text).translate(_XML_TRANS)):
+                if p := p.strip():
+                    story.append(rl.Paragraph(_SINGLE_NL.sub("<br/>", p), rl.body_style))
+            story.append(rl.Spacer(1, 6))
 
         # Add the core sections in intended order with good spacing
-        add_long_text_as_paragraphs("Company Overview", plan.get("company_overview", ""))
-        add_long_text_as_paragraphs("Key Findings", plan.get("key_findings", ""))
-        add_long_text_as_paragraphs("Pain Points", plan.get("pain_points", ""))
-        add_long_text_as_paragraphs("Opportunities", plan.get("opportunities", ""))
-        add_long_text_as_paragraphs("Competitors", plan.get("competitors", ""))
-        add_long_text_as_paragraphs("Recommended Strategy", plan.get("recommended_strategy", ""))
+        add_long_text_as_paragraphs("Company Overview", overview)
+        add_long_text_as_paragraphs("Key Findings", findings)
+        add_long_text_as_paragraphs("Pain Points", pains)
+        add_long_text_as_paragraphs("Opportunities", opps)
+        add_long_text_as_paragraphs("Competitors", comps)
+        add_long_text_as_paragraphs("Recommended Strategy", strat)
 
         # Sources - render as compact table (wrap URLs)
-        sources = plan.get("sources", []) or []
-        story.append(Spacer(1, 8))
-        story.append(Paragraph("Sources", heading_style))
+        story.append(rl.Spacer(1, 8))
+        story.append(rl.Paragraph("Sources", rl.heading_style))
         if sources:
-            # limit sources to reasonable number
             data = [["#", "Source"]]
-            for i, s in enumerate(sources[:150], start=1):
-                data.append([str(i), s])
+            data.extend([n, s] for n, s in zip(_NUMS, sources))
             col_widths = [20, doc.width - 20]
-            tbl = Table(data, colWidths=col_widths, hAlign='LEFT')
-            tbl.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#f0f0f0")),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor("#333333")),
-                ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor("#DDDDDD")),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('LEFTPADDING', (0,0), (-1,-1), 6),
-                ('RIGHTPADDING', (0,0), (-1,-1), 6),
-            ]))
+            tbl = rl.Table(data, colWidths=col_widths, hAlign='LEFT')
+            tbl.setStyle(rl.sources_tbl_style)
             story.append(tbl)
         else:
-            story.append(Paragraph("<i>No sources available</i>", small_style))
+            story.append(rl.Paragraph("<i>No sources available</i>", rl.small_style))
 
-        # Build PDF
-        doc.build(story)
+        # Build PDF off the event loop
+        async with _PDF_SEM:
+            await run_in_threadpool(doc.build, story)
 
-        buffer.seek(0)
-        filename = payload.get("filename") or "account_plan.pdf"
-        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-        return StreamingResponse(buffer, media_type="application/pdf", headers=headers)
+        data = buffer.getvalue()
+        _PDF_CACHE[cache_key] = data
+        return _pdf_response(data, filename)
 
     except Exception as e:
         logger.exception("export_pdf failed: %s", e)
-        return JSONResponse(status_code=500, content={"error": "export_pdf_failed", "detail": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": "export_pdf_failed", "detail": str(e)})
 
 @app.post("/api/chat")
-async def api_chat(payload: Dict[str, Any]):
+async def api_chat(payload: Dict[str, Any], request: Request):
     """
     Q/A chat about the existing plan.
     Uses ChatAgent to answer questions grounded ONLY in the plan.
@@ -287,21 +509,31 @@ async def api_chat(payload: Dict[str, Any]):
         plan = payload.get("plan")
 
         if not question:
-            return JSONResponse(status_code=400, content={"error": "missing_question"})
+            return _ERR_MISSING_QUESTION
         if not plan:
-            return JSONResponse(status_code=400, content={"error": "missing_plan"})
-
-        # Import ChatAgent only where needed (lazy load)
-        from agent.chat_agent import ChatAgent
-        chat_agent = ChatAgent()
+            return _ERR_MISSING_PLAN
 
-        answer = chat_agent.answer(question, plan)
-        return JSONResponse(status_code=200, content={"answer": answer})
+        # answer() blocks on embedding/generation calls and rate-limit backoff; keep it off the event loop
+        answer = await run_in_threadpool(_get_chat_agent().answer, question, plan)
+        return _negotiated_response(request, {"answer": answer})
 
     except Exception as e:
         logger.exception("api_chat failed: %s", e)
-        return JSONResponse(status_code=500, content={"error": "chat_failed", "detail": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": "chat_failed", "detail": str(e)})
 
 if __name__ == "__main__":
     logger.info("Starting server on http://0.0.0.0:8000")
-    uvicorn.run("server:app", host="0.0.0.0", port=8000, reload=True)
+    dev = bool(os.getenv("DEV"))
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8000,
+        # uvloop is installed with uvicorn[standard] everywhere except Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # One process by default: the Gemini/PDF concurrency caps, the plan/PDF/answer
+        # caches and request dedupe are all per process. uvicorn ignores workers when
+        # reload is on, so DEV always runs a single reloading process.
+        workers=1 if dev else int(os.getenv("WEB_CONCURRENCY", "1")),
+        reload=dev,
+    )
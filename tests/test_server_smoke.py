@@ -0,0 +1,64 @@
+# tests/test_server_smoke.py
+"""
+Smoke tests for the FastAPI endpoints with the research pipeline stubbed out,
+so they run without network access or real API keys.
+
+Run from the project root:  python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("TAVILY_API_KEY", "test")
+os.environ.setdefault("CACHE_DB_PATH", os.path.join(tempfile.mkdtemp(), "cache.sqlite3"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import server  # noqa: E402
+
+
+class ResearchEndpointTest(unittest.TestCase):
+    def setUp(self):
+        server._PLAN_CACHE.clear()
+        server._INFLIGHT.clear()
+        self.client = TestClient(server.app)
+        self.search = mock.patch.object(
+            server.research_agent, "search_company", return_value=("research text", ["http://example.com"])
+        ).start()
+        self.generate = mock.patch.object(
+            server.research_agent, "generate_account_plan",
+            side_effect=lambda text, sources, company: {"company_overview": company, "sources": sources},
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_cache_miss_runs_research_then_hits_cache(self):
+        r = self.client.post("/api/research", json={"query": "Tesla"})
+        self.assertEqual(r.status_code, 200, r.text)
+        self.assertEqual(r.json()["plan"]["sources"], ["http://example.com"])
+        self.assertEqual(self.search.call_count, 1)
+        self.assertEqual(server._INFLIGHT, {})
+
+        r = self.client.post("/api/research", json={"query": "  tesla "})
+        self.assertEqual(r.status_code, 200, r.text)
+        self.assertEqual(self.search.call_count, 1)
+
+    def test_research_prefix_is_stripped_only_as_a_word(self):
+        for query, company in [("Research  Tesla", "Tesla"), ("ResearchGate", "ResearchGate"),
+                               ("research In Motion", "In Motion")]:
+            r = self.client.post("/api/research", json={"query": query})
+            self.assertEqual(r.status_code, 200, r.text)
+            self.assertEqual(r.json()["plan"]["company_overview"], company)
+
+    def test_rejects_query_without_letters(self):
+        for query in ["1234!!", "Research"]:
+            r = self.client.post("/api/research", json={"query": query})
+            self.assertEqual(r.status_code, 400)
+            self.assertEqual(r.json()["error"], "invalid_input")
+        self.search.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()